@@ -9,12 +9,19 @@ Provides real-time Wi-Fi network visualization and data export.
 """
 
 import os
-import json
+import io
+import csv
+import orjson
 import sqlite3
 import math
+import functools
 import time
-from datetime import datetime, timedelta
-from flask import Flask, render_template, jsonify, request, send_file
+import tempfile
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
+from flask_caching import Cache
 from flask_cors import CORS
 import threading
 import queue
@@ -24,26 +31,170 @@ RADAR_DIR = "/data/data/com.termux/files/home/radar"
 DB_PATH = os.path.join(RADAR_DIR, "data", "scans.db")
 EXPORT_DIR = os.path.join(RADAR_DIR, "exports")
 
+# Polled endpoints are served from cache for this many seconds
+API_CACHE_TIMEOUT = 2
+
+# Radar position columns precomputed by the scanner at write time
+POSITION_COLUMNS = (
+    ('pos_x', 'REAL'),
+    ('pos_y', 'REAL'),
+    ('pos_angle', 'INTEGER'),
+    ('pos_radius', 'REAL')
+)
+
+EXPORT_MIMETYPES = {
+    'json': 'application/json',
+    'csv': 'text/csv',
+    'kml': 'application/vnd.google-earth.kml+xml'
+}
+
+KML_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+<Document>
+    <name>CIVOPS-Radar Scan Results</name>
+    <description>Wi-Fi network scan results</description>
+'''
+
+KML_FOOTER = '''
+</Document>
+</kml>'''
+
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
 
 # Global variables for real-time updates
 scan_queue = queue.Queue()
 last_scan_time = None
 
+# Write buffer for the archived copy of each export in EXPORT_DIR
+EXPORT_BUFFER_SIZE = 1 << 20
+
+def _bssid_int(bssid):
+    """Stable integer for a BSSID, parsed from its MAC address"""
+    try:
+        return int(bssid.replace(':', ''), 16)
+    except ValueError:
+        # Not a MAC address; fall back to a checksum that is still stable
+        # across restarts, unlike the salted built-in hash()
+        return zlib.crc32(bssid.encode())
+
+def _bssid_hash(bssid):
+    """Stable, well-mixed hash of a BSSID for spreading networks out"""
+    # Consecutive MACs (multi-SSID radios, same-vendor APs) would otherwise
+    # land next to each other after a plain modulo
+    return zlib.crc32(_bssid_int(bssid).to_bytes(6, 'big'))
+
+@functools.lru_cache(maxsize=4096)
+def _radar_position(bssid, distance):
+    """Compute (x, y, angle, radius) for a BSSID at a given distance"""
+    # Use stable BSSID hash for consistent angle
+    hash_val = _bssid_hash(bssid) % 360
+    angle = math.radians(hash_val)
+    
+    # Calculate position based on signal strength
+    # Stronger signals appear closer to center
+    max_distance = 200  # meters
+    normalized_distance = min(distance / max_distance, 1.0)
+    radius = (1 - normalized_distance) * 0.8  # 80% of radar radius
+    
+    return radius * math.cos(angle), radius * math.sin(angle), hash_val, radius
+
 class RadarData:
     """Handle radar data operations and calculations"""
     
+    # Hot queries are kept as fixed strings so each pooled connection's
+    # statement cache reuses the compiled statement instead of re-parsing
+    
+    # Newest row per BSSID, resolved through the primary key instead of
+    # a correlated MAX(timestamp) subquery evaluated for every row
+    _LATEST_IDS = 'SELECT MAX(id) FROM scans GROUP BY bssid'
+    
+    _Q_LATEST = f'''
+        SELECT 
+            bssid, ssid, capabilities, frequency, level, distance, 
+            risk_score, is_hidden, is_open, vendor, first_seen, last_seen,
+            scan_count, timestamp
+        FROM scans
+        WHERE id IN ({_LATEST_IDS})
+        ORDER BY timestamp DESC
+        LIMIT ?
+    '''
+    
+    # Latest scans shaped for the radar display, with stored positions
+    _Q_SIGNALS = f'''
+        SELECT 
+            bssid, COALESCE(NULLIF(ssid, ''), 'Hidden') AS ssid, level, distance,
+            risk_score, is_hidden, is_open, capabilities, frequency, vendor,
+            last_seen, scan_count, pos_x, pos_y, pos_angle, pos_radius
+        FROM scans
+        WHERE id IN ({_LATEST_IDS})
+        ORDER BY timestamp DESC
+        LIMIT ?
+    '''
+    
+    # Single pass over the table with conditional aggregation
+    _Q_STATS = '''
+        SELECT
+            COUNT(DISTINCT bssid),
+            SUM(CASE WHEN timestamp > :cutoff THEN 1 ELSE 0 END),
+            SUM(CASE WHEN timestamp > :cutoff AND risk_score > 50 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN timestamp > :cutoff AND is_open = 1 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN timestamp > :cutoff AND is_hidden = 1 THEN 1 ELSE 0 END)
+        FROM scans
+    '''
+    
+    # Recent rows for one BSSID; the newest doubles as the current record
+    _Q_NET = '''
+        SELECT * FROM scans 
+        WHERE bssid = ? 
+        ORDER BY timestamp DESC 
+        LIMIT 20
+    '''
+    
     def __init__(self, db_path):
         self.db_path = db_path
+        self._pool = queue.LifoQueue()
         self.ensure_database()
     
+    def _connect(self):
+        """Open a new database connection tuned for concurrent reads"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        
+        # WAL lets request threads read while the scanner writes
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA cache_size=-20000')  # ~20 MB page cache
+        
+        return conn
+    
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection and return it to the pool when done"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        
+        try:
+            yield conn
+        finally:
+            # Never hand a connection with an open transaction to the next caller
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+    
     def ensure_database(self):
         """Ensure database exists and is properly initialized"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
-        conn = sqlite3.connect(self.db_path)
+        # WAL mode is persistent, so switching it here also applies to the
+        # scanner's own connections to the same database file
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Create tables if they don't exist
@@ -63,147 +214,209 @@ class RadarData:
                 vendor TEXT,
                 first_seen DATETIME DEFAULT CURRENT_TIMESTAMP,
                 last_seen DATETIME DEFAULT CURRENT_TIMESTAMP,
-                scan_count INTEGER DEFAULT 1
+                scan_count INTEGER DEFAULT 1,
+                pos_x REAL,
+                pos_y REAL,
+                pos_angle INTEGER,
+                pos_radius REAL
             )
         ''')
         
+        self._migrate_position_columns(cursor)
+        
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_bssid ON scans(bssid)
+            CREATE INDEX IF NOT EXISTS idx_timestamp ON scans(timestamp)
         ''')
+        # Serves bssid lookups and per-BSSID history ordered by time
+        # without a separate sort step
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_timestamp ON scans(timestamp)
+            CREATE INDEX IF NOT EXISTS idx_bssid_ts ON scans(bssid, timestamp DESC)
         ''')
         
+        # idx_bssid_ts covers every lookup the plain bssid index served
+        cursor.execute('DROP INDEX IF EXISTS idx_bssid')
+        
+        # Refresh planner statistics on every startup so they follow the
+        # table as it grows; 0x10002 checks all tables, not just ones this
+        # connection has queried
+        cursor.execute('PRAGMA optimize=0x10002')
+        
         conn.commit()
         conn.close()
     
+    def _migrate_position_columns(self, cursor):
+        """Add and backfill radar position columns on older databases"""
+        cursor.execute('PRAGMA table_info(scans)')
+        columns = {row['name'] for row in cursor.fetchall()}
+        
+        missing = [(name, sql_type) for name, sql_type in POSITION_COLUMNS
+                   if name not in columns]
+        if not missing:
+            return
+        
+        for name, sql_type in missing:
+            cursor.execute(f'ALTER TABLE scans ADD COLUMN {name} {sql_type}')
+        
+        cursor.execute('SELECT id, bssid, distance FROM scans WHERE pos_x IS NULL')
+        positions = [
+            _radar_position(row['bssid'], round(row['distance'] or 0.0, 1)) + (row['id'],)
+            for row in cursor.fetchall()
+        ]
+        cursor.executemany('''
+            UPDATE scans SET pos_x = ?, pos_y = ?, pos_angle = ?, pos_radius = ?
+            WHERE id = ?
+        ''', positions)
+    
     def get_latest_scans(self, limit=100):
         """Get latest scan results for radar display"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        query = '''
-            SELECT 
-                bssid, ssid, capabilities, frequency, level, distance, 
-                risk_score, is_hidden, is_open, vendor, first_seen, last_seen,
-                scan_count, timestamp
-            FROM scans s1
-            WHERE timestamp = (
-                SELECT MAX(timestamp) 
-                FROM scans s2 
-                WHERE s2.bssid = s1.bssid
-            )
-            ORDER BY timestamp DESC
-            LIMIT ?
-        '''
+        return [dict(row) for row in self.iter_latest_scans(limit)]
+    
+    def iter_latest_scans(self, limit=100):
+        """Yield latest scan results one row at a time"""
+        with self.connection() as conn:
+            yield from conn.execute(self._Q_LATEST, (limit,))
+    
+    def get_radar_signals(self, limit=50):
+        """Get latest scans with their radar positions for display"""
+        with self.connection() as conn:
+            rows = conn.execute(self._Q_SIGNALS, (limit,)).fetchall()
+        
+        signals = []
+        for row in rows:
+            signal = dict(row)
+            signal['position'] = self._pop_position(signal)
+            signals.append(signal)
+        
+        return signals
+    
+    def _pop_position(self, record):
+        """Replace a record's stored pos_* columns with a position dict"""
+        x, y, angle, radius = (record.pop(name) for name, _ in POSITION_COLUMNS)
         
-        cursor.execute(query, (limit,))
-        columns = [description[0] for description in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        # Positions are written by the scanner; compute any that are missing
+        if x is None:
+            return self.calculate_radar_position(
+                record['bssid'], record['level'], record['distance'])
         
-        conn.close()
-        return results
+        return {
+            'x': x,
+            'y': y,
+            'angle': angle,
+            'radius': radius
+        }
     
     def get_scan_statistics(self):
         """Get overall scan statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        stats = {}
-        
-        # Total networks discovered
-        cursor.execute("SELECT COUNT(DISTINCT bssid) FROM scans")
-        stats['total_networks'] = cursor.fetchone()[0]
-        
-        # Currently active networks
-        cursor.execute("SELECT COUNT(*) FROM scans WHERE timestamp > datetime('now', '-5 minutes')")
-        stats['active_networks'] = cursor.fetchone()[0]
-        
-        # High risk networks
-        cursor.execute("SELECT COUNT(*) FROM scans WHERE risk_score > 50 AND timestamp > datetime('now', '-5 minutes')")
-        stats['high_risk_networks'] = cursor.fetchone()[0]
-        
-        # Open networks
-        cursor.execute("SELECT COUNT(*) FROM scans WHERE is_open = 1 AND timestamp > datetime('now', '-5 minutes')")
-        stats['open_networks'] = cursor.fetchone()[0]
-        
-        # Hidden networks
-        cursor.execute("SELECT COUNT(*) FROM scans WHERE is_hidden = 1 AND timestamp > datetime('now', '-5 minutes')")
-        stats['hidden_networks'] = cursor.fetchone()[0]
+        # Networks seen in the last 5 minutes count as active. The bound is
+        # computed once here in SQLite's UTC text format rather than
+        # evaluating datetime('now', ...) inside the query
+        cutoff = (datetime.now(timezone.utc) - timedelta(minutes=5)).strftime('%Y-%m-%d %H:%M:%S')
+        
+        with self.connection() as conn:
+            row = conn.execute(self._Q_STATS, {'cutoff': cutoff}).fetchone()
+        
+        total, active, high_risk, open_count, hidden = row
+        
+        # SUM() yields NULL on an empty table
+        stats = {
+            'total_networks': total,
+            'active_networks': active or 0,
+            'high_risk_networks': high_risk or 0,
+            'open_networks': open_count or 0,
+            'hidden_networks': hidden or 0
+        }
         
-        conn.close()
         return stats
     
+    def get_network_details(self, bssid):
+        """Get the latest scan and recent history for a network"""
+        with self.connection() as conn:
+            rows = conn.execute(self._Q_NET, (bssid,)).fetchall()
+        
+        if not rows:
+            return None
+        
+        network = dict(rows[0])
+        network['position'] = self._pop_position(network)
+        history = [{
+            'timestamp': row['timestamp'],
+            'level': row['level'],
+            'distance': row['distance'],
+            'risk_score': row['risk_score']
+        } for row in rows]
+        
+        network['history'] = history
+        return network
+    
     def calculate_radar_position(self, bssid, level, distance):
         """Calculate radar position for network visualization"""
-        # Use BSSID hash for consistent angle
-        hash_val = hash(bssid) % 360
-        angle = math.radians(hash_val)
-        
-        # Calculate position based on signal strength
-        # Stronger signals appear closer to center
-        max_distance = 200  # meters
-        normalized_distance = min(distance / max_distance, 1.0)
-        radius = (1 - normalized_distance) * 0.8  # 80% of radar radius
-        
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
+        # Quantize distance so repeat sightings hit the position cache
+        x, y, angle, radius = _radar_position(bssid, round(distance or 0.0, 1))
         
         return {
             'x': x,
             'y': y,
-            'angle': hash_val,
+            'angle': angle,
             'radius': radius
         }
     
     def export_data(self, format_type='json'):
-        """Export scan data in specified format"""
-        scans = self.get_latest_scans(limit=1000)
-        
-        if format_type == 'json':
-            return json.dumps(scans, indent=2, default=str)
-        elif format_type == 'csv':
-            import csv
-            import io
-            
-            output = io.StringIO()
-            if scans:
-                writer = csv.DictWriter(output, fieldnames=scans[0].keys())
-                writer.writeheader()
-                writer.writerows(scans)
-            return output.getvalue()
-        elif format_type == 'kml':
-            return self.generate_kml(scans)
-        else:
-            raise ValueError(f"Unsupported format: {format_type}")
-    
-    def generate_kml(self, scans):
-        """Generate KML file for Google Earth visualization"""
-        kml_header = '''<?xml version="1.0" encoding="UTF-8"?>
-<kml xmlns="http://www.opengis.net/kml/2.2">
-<Document>
-    <name>CIVOPS-Radar Scan Results</name>
-    <description>Wi-Fi network scan results</description>
-'''
+        """Export scan data in specified format as an iterator of text chunks"""
+        exporters = {
+            'json': self._export_json,
+            'csv': self._export_csv,
+            'kml': self._export_kml
+        }
         
-        kml_footer = '''
-</Document>
-</kml>'''
+        if format_type not in exporters:
+            raise ValueError(f"Unsupported format: {format_type}")
         
-        kml_content = kml_header
+        return exporters[format_type](self.iter_latest_scans(limit=1000))
+    
+    def _export_json(self, scans):
+        """Stream scans as a JSON array, one encoded object per chunk"""
+        yield b'['
+        for i, scan in enumerate(scans):
+            yield (b',\n  ' if i else b'\n  ') + orjson.dumps(dict(scan), default=str)
+        yield b'\n]'
+    
+    def _export_csv(self, scans):
+        """Stream scans as CSV, one row per chunk"""
+        output = io.StringIO()
+        writer = csv.writer(output)
+        header = True
         
         for scan in scans:
-            if scan['ssid'] and scan['ssid'] != '':
-                name = scan['ssid']
-            else:
-                name = f"Hidden Network ({scan['bssid']})"
-            
-            # Generate random coordinates for visualization
-            # In real implementation, this would use GPS coordinates
-            lat = 37.7749 + (hash(scan['bssid']) % 1000 - 500) / 100000
-            lon = -122.4194 + (hash(scan['bssid']) % 1000 - 500) / 100000
+            if header:
+                writer.writerow(scan.keys())
+                header = False
+            writer.writerow(scan)
             
-            kml_content += f'''
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+    
+    def _export_kml(self, scans):
+        """Stream scans as KML, one placemark per chunk"""
+        yield KML_HEADER
+        for scan in scans:
+            yield self._kml_placemark(scan)
+        yield KML_FOOTER
+    
+    def _kml_placemark(self, scan):
+        """Render a single scan as a KML placemark"""
+        if scan['ssid'] and scan['ssid'] != '':
+            name = scan['ssid']
+        else:
+            name = f"Hidden Network ({scan['bssid']})"
+        
+        # Generate random coordinates for visualization
+        # In real implementation, this would use GPS coordinates
+        offset = (_bssid_hash(scan['bssid']) % 1000 - 500) / 100000
+        lat = 37.7749 + offset
+        lon = -122.4194 + offset
+        
+        return f'''
     <Placemark>
         <name>{name}</name>
         <description>
@@ -216,51 +429,100 @@ class RadarData:
             <coordinates>{lon},{lat},0</coordinates>
         </Point>
     </Placemark>'''
-        
-        kml_content += kml_footer
-        return kml_content
+    
+    def generate_kml(self, scans):
+        """Generate KML file for Google Earth visualization"""
+        # Join once rather than growing a string placemark by placemark
+        return ''.join(self._export_kml(scans))
 
 # Initialize radar data handler
 radar_data = RadarData(DB_PATH)
 
+def claim_export_path(filepath):
+    """Atomically create an unused export path, adding a suffix on collision"""
+    base, ext = os.path.splitext(filepath)
+    candidate, n = filepath, 1
+    
+    while True:
+        try:
+            with open(candidate, 'xb'):
+                return candidate
+        except FileExistsError:
+            candidate = f"{base}_{n}{ext}"
+            n += 1
+
+def open_export_archive(filepath):
+    """Open a unique temp file next to filepath, or None if that fails"""
+    try:
+        # Unique temp file so concurrent exports never share a partial file
+        fd, partial = tempfile.mkstemp(dir=os.path.dirname(filepath), suffix='.part')
+    except OSError as error:
+        app.logger.error("Failed to archive export: %s", error)
+        return None, None
+    
+    return os.fdopen(fd, 'wb', buffering=EXPORT_BUFFER_SIZE), partial
+
+def close_export_archive(archive, partial, filepath, completed):
+    """Keep a completed archive under filepath, otherwise discard it"""
+    try:
+        archive.close()
+        if completed:
+            # Never overwrite an earlier export from the same second
+            os.replace(partial, claim_export_path(filepath))
+            return
+    except OSError as error:
+        app.logger.error("Failed to archive export: %s", error)
+    
+    try:
+        os.remove(partial)
+    except FileNotFoundError:
+        pass
+
+def tee_export(chunks, filepath):
+    """Yield chunks as bytes to the client while archiving them to disk"""
+    # The archive is written inline through a buffered file, so it lives
+    # and dies with the download and never outlasts the request
+    archive, partial = open_export_archive(filepath)
+    
+    completed = False
+    try:
+        for chunk in chunks:
+            data = chunk if isinstance(chunk, bytes) else chunk.encode('utf-8')
+            if archive is not None:
+                try:
+                    archive.write(data)
+                except OSError as error:
+                    # Keep serving the download without an archive
+                    app.logger.error("Failed to archive export: %s", error)
+                    close_export_archive(archive, partial, filepath, False)
+                    archive = None
+            yield data
+        completed = True
+    finally:
+        if archive is not None:
+            close_export_archive(archive, partial, filepath, completed)
+
+def json_response(obj):
+    """Serialize obj with orjson into a JSON response"""
+    return Response(orjson.dumps(obj, default=str), mimetype='application/json')
+
+def is_cacheable(response):
+    """Only cache successful responses; errors are returned as tuples"""
+    return not isinstance(response, tuple)
+
 @app.route('/')
 def index():
     """Main radar interface"""
     return render_template('radar.html')
 
 @app.route('/api/signals')
+@cache.cached(timeout=API_CACHE_TIMEOUT, response_filter=is_cacheable)
 def get_signals():
     """Get latest scan signals for radar display"""
     try:
-        scans = radar_data.get_latest_scans(limit=50)
+        radar_signals = radar_data.get_radar_signals(limit=50)
         
-        # Process scans for radar display
-        radar_signals = []
-        for scan in scans:
-            position = radar_data.calculate_radar_position(
-                scan['bssid'], 
-                scan['level'], 
-                scan['distance']
-            )
-            
-            signal = {
-                'bssid': scan['bssid'],
-                'ssid': scan['ssid'] or 'Hidden',
-                'level': scan['level'],
-                'distance': scan['distance'],
-                'risk_score': scan['risk_score'],
-                'is_hidden': scan['is_hidden'],
-                'is_open': scan['is_open'],
-                'capabilities': scan['capabilities'],
-                'frequency': scan['frequency'],
-                'vendor': scan['vendor'],
-                'last_seen': scan['last_seen'],
-                'scan_count': scan['scan_count'],
-                'position': position
-            }
-            radar_signals.append(signal)
-        
-        return jsonify({
+        return json_response({
             'signals': radar_signals,
             'timestamp': datetime.now().isoformat()
         })
@@ -269,11 +531,12 @@ def get_signals():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/statistics')
+@cache.cached(timeout=API_CACHE_TIMEOUT, response_filter=is_cacheable)
 def get_statistics():
     """Get scan statistics"""
     try:
         stats = radar_data.get_scan_statistics()
-        return jsonify(stats)
+        return json_response(stats)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -281,22 +544,24 @@ def get_statistics():
 def export_data(format_type):
     """Export scan data in specified format"""
     try:
-        if format_type not in ['json', 'csv', 'kml']:
+        if format_type not in EXPORT_MIMETYPES:
             return jsonify({'error': 'Unsupported format'}), 400
         
-        data = radar_data.export_data(format_type)
+        chunks = radar_data.export_data(format_type)
         
-        # Save to file
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"radar_export_{timestamp}.{format_type}"
         filepath = os.path.join(EXPORT_DIR, filename)
         
         os.makedirs(EXPORT_DIR, exist_ok=True)
         
-        with open(filepath, 'w') as f:
-            f.write(data)
-        
-        return send_file(filepath, as_attachment=True, download_name=filename)
+        # Stream rows to the client as they are read from the database,
+        # saving a copy to EXPORT_DIR in the background
+        return Response(
+            stream_with_context(tee_export(chunks, filepath)),
+            mimetype=EXPORT_MIMETYPES[format_type],
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+        )
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -305,48 +570,12 @@ def export_data(format_type):
 def get_network_details(bssid):
     """Get detailed information about a specific network"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Get latest scan for this BSSID
-        cursor.execute('''
-            SELECT * FROM scans 
-            WHERE bssid = ? 
-            ORDER BY timestamp DESC 
-            LIMIT 1
-        ''', (bssid,))
+        network = radar_data.get_network_details(bssid)
         
-        columns = [description[0] for description in cursor.description]
-        result = cursor.fetchone()
-        
-        if result:
-            network = dict(zip(columns, result))
-            
-            # Get historical data
-            cursor.execute('''
-                SELECT timestamp, level, distance, risk_score
-                FROM scans 
-                WHERE bssid = ? 
-                ORDER BY timestamp DESC 
-                LIMIT 20
-            ''', (bssid,))
-            
-            history = []
-            for row in cursor.fetchall():
-                history.append({
-                    'timestamp': row[0],
-                    'level': row[1],
-                    'distance': row[2],
-                    'risk_score': row[3]
-                })
-            
-            network['history'] = history
-            
-            conn.close()
-            return jsonify(network)
-        else:
-            conn.close()
+        if network is None:
             return jsonify({'error': 'Network not found'}), 404
+        
+        return jsonify(network)
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
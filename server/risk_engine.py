@@ -9,7 +9,7 @@ Evaluates security posture and potential threats based on network characteristic
 """
 
 import re
-import math
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
@@ -58,10 +58,30 @@ class RiskEngine:
             r'(?i)(backdoor|trojan|virus)'
         ]
         
+        # Fuse all patterns into one alternation with a named group per
+        # pattern, so a single pass reports which patterns matched. Each
+        # group sits in a lookahead so matches can overlap: in 'rootrojan'
+        # both 'root' and 'trojan' must be found
+        self._suspicious_re = re.compile(
+            '|'.join(f'(?=(?P<p{i}>{pattern[4:]}))'
+                     for i, pattern in enumerate(self.suspicious_patterns)),
+            re.IGNORECASE
+        )
+        
+        # Standard 2.4 GHz channel center frequencies (channels 1-14)
+        self._valid_24ghz = frozenset({
+            2412, 2417, 2422, 2427, 2432, 2437, 2442,
+            2447, 2452, 2457, 2462, 2467, 2472, 2484
+        })
+        
         self.risky_vendors = [
             'Cisco', 'Linksys', 'Netgear', 'D-Link', 'TP-Link',
             'Belkin', 'ASUS', 'Ubiquiti', 'Mikrotik'
         ]
+        self._risky_vendors = frozenset(self.risky_vendors)
+        
+        # Longer WPA variants come first so they are not read as plain WPA
+        self._encryption_re = re.compile(r'WEP|WPA3|WPA2|WPA')
         
         self.encryption_strength = {
             'WEP': 0,      # Very weak
@@ -118,6 +138,70 @@ class RiskEngine:
         
         return total_score, factors
     
+    def score_batch(self, networks) -> np.ndarray:
+        """
+        Calculate risk scores for many networks at once
+        
+        Vectorized counterpart of calculate_risk_score for bulk recomputation.
+        Historical factors (signal fluctuation, temporal risk) are not applied,
+        matching calculate_risk_score called without historical_data.
+        
+        Args:
+            networks: DataFrame, structured array or dict of columns with
+                ssid, capabilities, frequency, level, is_hidden, is_open and
+                optionally vendor
+            
+        Returns:
+            Integer array of total risk scores (0-100)
+        """
+        level = np.asarray(networks['level'], dtype=np.int64)
+        frequency = np.asarray(networks['frequency'], dtype=np.int64)
+        is_open = np.asarray(networks['is_open'], dtype=bool)
+        is_hidden = np.asarray(networks['is_hidden'], dtype=bool)
+        capabilities = np.char.upper(np.asarray(networks['capabilities'], dtype=str))
+        
+        open_risk = np.where(is_open, 30, 0)
+        hidden_risk = np.where(is_hidden, 20, 0)
+        
+        # Same precedence as _assess_encryption_strength
+        has_wep = np.char.find(capabilities, 'WEP') >= 0
+        has_wpa = np.char.find(capabilities, 'WPA') >= 0
+        has_wpa2 = np.char.find(capabilities, 'WPA2') >= 0
+        has_wpa3 = np.char.find(capabilities, 'WPA3') >= 0
+        encryption_risk = np.select(
+            [is_open, has_wep, has_wpa & ~has_wpa2, has_wpa2 & ~has_wpa3, has_wpa3],
+            [0, 25, 15, 5, 0],
+            default=20
+        )
+        
+        # Regex matching has no vectorized form; score each SSID directly.
+        # Converting to str first decodes byte-string (S dtype) columns
+        ssids = np.array([ssid or '' for ssid in networks['ssid']], dtype=str)
+        ssid_risk = np.fromiter(
+            (self._score_ssid(ssid) if ssid else 0 for ssid in ssids),
+            dtype=np.int64, count=len(level)
+        )
+        
+        proximity_risk = ((level > -30) * 10
+                          + ((level > -50) & (level <= -30)) * 5
+                          + (level < -80) * 5)
+        
+        try:
+            vendors = networks['vendor']
+        except (KeyError, ValueError):
+            vendor_risk = 0
+        else:
+            vendors = np.array([vendor or '' for vendor in vendors], dtype=str)
+            vendor_risk = np.isin(vendors, list(self._risky_vendors)) * 5
+        
+        beacon_risk = (np.isin(frequency, list(self._valid_24ghz), invert=True) * 10
+                       + ((frequency < 2400) | (frequency > 2500)) * 15)
+        
+        total = (open_risk + hidden_risk + encryption_risk + ssid_risk
+                 + proximity_risk + vendor_risk + beacon_risk)
+        
+        return np.clip(total, 0, 100)
+    
     def _assess_open_network(self, network: NetworkProfile) -> int:
         """Assess risk of open networks"""
         if network.is_open:
@@ -135,16 +219,17 @@ class RiskEngine:
         if network.is_open:
             return 0  # Already counted in open_network
         
-        capabilities = network.capabilities.upper()
+        # Collect every encryption token in one scan of the string
+        found = set(self._encryption_re.findall(network.capabilities.upper()))
         
         # Check for weak encryption
-        if 'WEP' in capabilities:
+        if 'WEP' in found:
             return 25  # Very high risk
-        elif 'WPA' in capabilities and 'WPA2' not in capabilities:
+        elif found and 'WPA2' not in found:
             return 15  # High risk
-        elif 'WPA2' in capabilities and 'WPA3' not in capabilities:
+        elif 'WPA2' in found and 'WPA3' not in found:
             return 5   # Low risk
-        elif 'WPA3' in capabilities:
+        elif 'WPA3' in found:
             return 0   # No additional risk
         else:
             return 20  # Unknown encryption
@@ -154,14 +239,14 @@ class RiskEngine:
         if not network.ssid:
             return 0
         
-        ssid = network.ssid.lower()
-        risk_score = 0
-        
-        for pattern in self.suspicious_patterns:
-            if re.search(pattern, ssid):
-                risk_score += 10
+        return self._score_ssid(network.ssid)
+    
+    def _score_ssid(self, ssid: str) -> int:
+        """Score an SSID string against the suspicious patterns"""
+        # Each distinct pattern matched adds 10 points
+        matched = {m.lastgroup for m in self._suspicious_re.finditer(ssid)}
         
-        return min(30, risk_score)  # Cap at 30 points
+        return min(30, 10 * len(matched))  # Cap at 30 points
     
     def _assess_signal_fluctuation(self, network: NetworkProfile, 
                                  historical_data: List[NetworkProfile]) -> int:
@@ -170,15 +255,16 @@ class RiskEngine:
             return 0
         
         # Get signal levels from historical data
-        signal_levels = [n.level for n in historical_data if n.bssid == network.bssid]
+        signal_levels = np.fromiter(
+            (n.level for n in historical_data if n.bssid == network.bssid),
+            dtype=np.float64
+        )
         
-        if len(signal_levels) < 3:
+        if signal_levels.size < 3:
             return 0
         
         # Calculate standard deviation
-        mean_level = sum(signal_levels) / len(signal_levels)
-        variance = sum((x - mean_level) ** 2 for x in signal_levels) / len(signal_levels)
-        std_dev = math.sqrt(variance)
+        std_dev = float(signal_levels.std())
         
         # High fluctuation indicates potential rogue AP
         if std_dev > 15:  # High fluctuation
@@ -210,7 +296,7 @@ class RiskEngine:
             return 0
         
         # Some vendors are more commonly targeted
-        if network.vendor in self.risky_vendors:
+        if network.vendor in self._risky_vendors:
             return 5
         
         return 0
@@ -220,7 +306,7 @@ class RiskEngine:
         risk_score = 0
         
         # Check for unusual frequency usage
-        if network.frequency not in [2412, 2417, 2422, 2427, 2432, 2437, 2442, 2447, 2452, 2457, 2462, 2467, 2472, 2484]:
+        if network.frequency not in self._valid_24ghz:
             risk_score += 10
         
         # Check for unusual channel usage
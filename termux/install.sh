@@ -87,7 +87,7 @@ install_python_deps() {
     pip install --upgrade pip
     
     # Install Flask and related packages
-    pip install flask flask-cors
+    pip install flask flask-cors flask-caching orjson
     
     # Install data processing packages
     pip install pandas numpy
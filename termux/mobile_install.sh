@@ -91,7 +91,7 @@ install_python_deps() {
         pip install -r requirements.txt
     else
         # Install core dependencies
-        pip install flask flask-cors pandas numpy requests beautifulsoup4
+        pip install flask flask-cors flask-caching orjson pandas numpy requests beautifulsoup4
     fi
     
     success "Python dependencies installed"
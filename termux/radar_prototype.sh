@@ -74,12 +74,17 @@ CREATE TABLE IF NOT EXISTS scans (
     vendor TEXT,
     first_seen DATETIME DEFAULT CURRENT_TIMESTAMP,
     last_seen DATETIME DEFAULT CURRENT_TIMESTAMP,
-    scan_count INTEGER DEFAULT 1
+    scan_count INTEGER DEFAULT 1,
+    pos_x REAL,
+    pos_y REAL,
+    pos_angle INTEGER,
+    pos_radius REAL
 );
 
-CREATE INDEX IF NOT EXISTS idx_bssid ON scans(bssid);
+CREATE INDEX IF NOT EXISTS idx_bssid_ts ON scans(bssid, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_timestamp ON scans(timestamp);
 CREATE INDEX IF NOT EXISTS idx_level ON scans(level);
+DROP INDEX IF EXISTS idx_bssid;
 
 -- Create view for latest scan results
 CREATE VIEW IF NOT EXISTS latest_scans AS
@@ -129,8 +134,10 @@ perform_scan() {
     # Process scan results with Python
     python3 -c "
 import json
+import math
 import sqlite3
 import sys
+import zlib
 from datetime import datetime
 
 def calculate_distance(rssi, frequency=2400):
@@ -175,11 +182,38 @@ def calculate_risk_score(ssid, capabilities, level, is_hidden):
     
     return min(100, max(0, score))
 
+def calculate_position(bssid, distance):
+    '''Calculate radar position (x, y, angle, radius), matching the web server'''
+    try:
+        bssid_value = int(bssid.replace(':', ''), 16)
+    except ValueError:
+        bssid_value = zlib.crc32(bssid.encode())
+    
+    # Mix the bits so consecutive MACs do not sit at adjacent angles
+    angle = zlib.crc32(bssid_value.to_bytes(6, 'big')) % 360
+    radius = (1 - min(round(distance, 1) / 200, 1.0)) * 0.8
+    
+    x = radius * math.cos(math.radians(angle))
+    y = radius * math.sin(math.radians(angle))
+    return x, y, angle, radius
+
+def ensure_position_columns(cursor):
+    '''Add radar position columns to databases created before they existed'''
+    cursor.execute('PRAGMA table_info(scans)')
+    columns = {row[1] for row in cursor.fetchall()}
+    
+    for name, sql_type in (('pos_x', 'REAL'), ('pos_y', 'REAL'),
+                           ('pos_angle', 'INTEGER'), ('pos_radius', 'REAL')):
+        if name not in columns:
+            cursor.execute(f'ALTER TABLE scans ADD COLUMN {name} {sql_type}')
+
 def process_scan_data(scan_json):
     conn = sqlite3.connect('$DB_PATH')
     cursor = conn.cursor()
     
     try:
+        ensure_position_columns(cursor)
+        
         scan_data = json.loads(scan_json)
         current_time = datetime.now().isoformat()
         
@@ -194,9 +228,10 @@ def process_scan_data(scan_json):
             is_hidden = ssid == '' or ssid == '<unknown ssid>'
             is_open = 'WPA' not in capabilities and 'WEP' not in capabilities
             
-            # Calculate distance and risk score
+            # Calculate distance, risk score and radar position
             distance = calculate_distance(level, frequency)
             risk_score = calculate_risk_score(ssid, capabilities, level, is_hidden)
+            pos_x, pos_y, pos_angle, pos_radius = calculate_position(bssid, distance)
             
             # Check if BSSID already exists
             cursor.execute('SELECT id, scan_count FROM scans WHERE bssid = ? ORDER BY timestamp DESC LIMIT 1', (bssid,))
@@ -207,18 +242,22 @@ def process_scan_data(scan_json):
                 cursor.execute('''
                     UPDATE scans 
                     SET timestamp = ?, level = ?, distance = ?, risk_score = ?, 
-                        last_seen = ?, scan_count = scan_count + 1
+                        last_seen = ?, scan_count = scan_count + 1,
+                        pos_x = ?, pos_y = ?, pos_angle = ?, pos_radius = ?
                     WHERE bssid = ?
-                ''', (current_time, level, distance, risk_score, current_time, bssid))
+                ''', (current_time, level, distance, risk_score, current_time,
+                      pos_x, pos_y, pos_angle, pos_radius, bssid))
             else:
                 # Insert new record
                 cursor.execute('''
                     INSERT INTO scans (bssid, ssid, capabilities, frequency, level, 
                                     distance, risk_score, is_hidden, is_open, 
-                                    first_seen, last_seen, scan_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+                                    first_seen, last_seen, scan_count,
+                                    pos_x, pos_y, pos_angle, pos_radius)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?, ?)
                 ''', (bssid, ssid, capabilities, frequency, level, distance, 
-                      risk_score, is_hidden, is_open, current_time, current_time))
+                      risk_score, is_hidden, is_open, current_time, current_time,
+                      pos_x, pos_y, pos_angle, pos_radius))
         
         conn.commit()
         print(f'Processed {len(scan_data)} networks')